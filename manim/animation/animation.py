@@ -1,27 +1,94 @@
 """Animate mobjects."""
 
+from __future__ import annotations
 
 __all__ = ["Animation", "Wait"]
 
 
-from copy import deepcopy
-from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple, Union
+import copy
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
+    from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
     from manim.scene.scene import Scene
 
-from .. import logger
+from .. import config, logger
 from ..mobject import mobject, opengl_mobject
 from ..mobject.mobject import Mobject
 from ..mobject.opengl_mobject import OpenGLMobject
-from ..utils.deprecation import deprecated
-from ..utils.rate_functions import smooth
+from ..utils.rate_functions import _VECTORIZED_RATE_FUNCS, smooth
 
 DEFAULT_ANIMATION_RUN_TIME: float = 1.0
 DEFAULT_ANIMATION_LAG_RATIO: float = 0.0
 
 
+def _compute_sub_alphas(alpha: float, n: int, lag_ratio: float) -> np.ndarray:
+    """Vectorized :meth:`Animation.get_sub_alpha` for all ``n`` submobjects."""
+    full_length = (n - 1) * lag_ratio + 1
+    return np.clip(alpha * full_length - np.arange(n) * lag_ratio, 0, 1)
+
+
+def _build_rate_lut(
+    rate_func: Callable[[float], float], run_time: float
+) -> Optional[Tuple[List[float], float]]:
+    """Evaluate ``rate_func`` at the alpha of every frame of an animation.
+
+    Returns the rate values together with the factor turning an alpha
+    into a frame index, or ``None`` if ``rate_func`` has no array version.
+    """
+    vectorized = _VECTORIZED_RATE_FUNCS.get(rate_func)
+    if vectorized is None or run_time <= 0:
+        return None
+    scale = run_time * config["frame_rate"]
+    alphas = np.arange(int(scale) + 1) / scale
+    return vectorized(alphas).tolist(), scale
+
+
+def _has_default_sub_alpha(animation: "Animation") -> bool:
+    return type(animation).get_sub_alpha is Animation.get_sub_alpha
+
+
 class Animation:
+    # Whether begin() should copy the mobject into starting_mobject.
+    # Subclasses whose interpolation never reads starting_mobject can
+    # set this to False, leaving the empty placeholder from __init__.
+    needs_starting_mobject: bool = True
+
+    __slots__ = (
+        "run_time",
+        "rate_func",
+        "name",
+        "remover",
+        "suspend_mobject_updating",
+        "lag_ratio",
+        "starting_mobject",
+        "mobject",
+        "_families_cache",
+        "_num_families",
+        "_family_width",
+        "_uniform_alpha",
+        "_default_sub_alpha",
+        "_all_mobjects",
+        "_fam_cache",
+        "_rate_lut",
+        # Arbitrary attributes are still allowed, e.g. the keyword
+        # arguments Scene.play() sets on its animations.
+        "__dict__",
+    )
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "CONFIG" in cls.__dict__:
+            logger.error(
+                (
+                    "CONFIG has been removed from ManimCommunity.",
+                    "Please use keyword arguments instead.",
+                )
+            )
+
     def __init__(
         self,
         mobject: Union[Mobject, None],
@@ -39,25 +106,56 @@ class Animation:
         **kwargs,
     ) -> None:
         self._typecheck_input(mobject)
+        self._init_attributes(
+            mobject if mobject is not None else Mobject(),
+            Mobject(),
+            lag_ratio=lag_ratio,
+            run_time=run_time,
+            rate_func=rate_func,
+            name=name,
+            remover=remover,
+            suspend_mobject_updating=suspend_mobject_updating,
+            **kwargs,
+        )
+
+    def _init_attributes(
+        self,
+        mobject: Mobject,
+        starting_mobject: Mobject,
+        lag_ratio: float = DEFAULT_ANIMATION_LAG_RATIO,
+        run_time: float = DEFAULT_ANIMATION_RUN_TIME,
+        rate_func: Callable[[float], float] = smooth,
+        name: str = None,
+        remover: bool = False,
+        suspend_mobject_updating: bool = True,
+        **kwargs,
+    ) -> None:
         self.run_time: float = run_time
         self.rate_func: Callable[[float], float] = rate_func
         self.name: Optional[str] = name
         self.remover: bool = remover
         self.suspend_mobject_updating: bool = suspend_mobject_updating
         self.lag_ratio: float = lag_ratio
-        self.starting_mobject: Mobject = Mobject()
-        self.mobject: Mobject = mobject if mobject is not None else Mobject()
+        self.starting_mobject: Mobject = starting_mobject
+        self.mobject: Mobject = mobject
+        # Zipped families of get_all_mobjects(), computed in begin() as
+        # the family structure stays the same while the animation runs.
+        self._families_cache: Optional[List[Tuple]] = None
+        self._num_families: int = 0
+        self._family_width: int = 0
+        # Whether get_sub_alpha() is not overridden, so that the sub-alphas
+        # can be computed all at once
+        self._default_sub_alpha: bool = _has_default_sub_alpha(self)
+        self._uniform_alpha: bool = self._default_sub_alpha and lag_ratio == 0
+        # (mobject, starting_mobject) while the animation is running
+        self._all_mobjects: Optional[Tuple[Mobject, Mobject]] = None
+        # family_members_with_points() of each mobject, keyed by its id
+        self._fam_cache: Dict[int, List[Mobject]] = {}
+        # Values of rate_func at the frames of the animation, see begin()
+        self._rate_lut: Optional[Tuple[List[float], float]] = None
         if kwargs:
             logger.debug("Animation received extra kwargs: %s", kwargs)
 
-        if hasattr(self, "CONFIG"):
-            logger.error(
-                (
-                    "CONFIG has been removed from ManimCommunity.",
-                    "Please use keyword arguments instead.",
-                )
-            )
-
     def _typecheck_input(self, mobject: Union[Mobject, None]) -> None:
         if mobject is None:
             logger.debug("Animation with empty mobject")
@@ -79,7 +177,10 @@ class Animation:
         # played.  As much initialization as possible,
         # especially any mobject copying, should live in
         # this method
-        self.starting_mobject = self.create_starting_mobject()
+        self._fam_cache.clear()
+        if self.needs_starting_mobject:
+            self.starting_mobject = self.create_starting_mobject()
+        self._all_mobjects = (self.mobject, self.starting_mobject)
         if self.suspend_mobject_updating:
             # All calls to self.mobject's internal updaters
             # during the animation, either from this Animation
@@ -88,11 +189,23 @@ class Animation:
             # the internal updaters of self.starting_mobject,
             # or any others among self.get_all_mobjects()
             self.mobject.suspend_updating()
+        self._families_cache = list(self.get_all_families_zipped())
+        self._num_families = len(self._families_cache)
+        self._family_width = len(self._families_cache[0]) if self._families_cache else 0
+        # lag_ratio may have been changed by Scene.play(), so this can only
+        # be determined here.
+        self._default_sub_alpha = _has_default_sub_alpha(self)
+        self._uniform_alpha = self._default_sub_alpha and self.lag_ratio == 0
+        self._rate_lut = _build_rate_lut(self.rate_func, self.run_time)
         self.interpolate(0)
 
     def finish(self) -> None:
         self.interpolate(1)
-        if self.suspend_mobject_updating and self.mobject is not None:
+        self._families_cache = None
+        self._all_mobjects = None
+        self._fam_cache.clear()
+        self._rate_lut = None
+        if self.suspend_mobject_updating:
             self.mobject.resume_updating()
 
     def clean_up_from_scene(self, scene: "Scene") -> None:
@@ -107,12 +220,23 @@ class Animation:
         """
         Ordering must match the ordering of arguments to interpolate_submobject
         """
+        if self._all_mobjects is not None:
+            return self._all_mobjects
         return self.mobject, self.starting_mobject
 
+    def _families_of(self, mob: Mobject) -> List[Mobject]:
+        # Only memoize while the animation is running, as finish() is what
+        # clears the caches again and the families may change in between.
+        if self._all_mobjects is None:
+            return mob.family_members_with_points()
+        key = id(mob)
+        family = self._fam_cache.get(key)
+        if family is None:
+            family = self._fam_cache[key] = mob.family_members_with_points()
+        return family
+
     def get_all_families_zipped(self) -> Iterable[Tuple]:
-        return zip(
-            *[mob.family_members_with_points() for mob in self.get_all_mobjects()]
-        )
+        return zip(*[self._families_of(mob) for mob in self.get_all_mobjects()])
 
     def update_mobjects(self, dt: float) -> None:
         """
@@ -129,25 +253,90 @@ class Animation:
         # The surrounding scene typically handles
         # updating of self.mobject.  Besides, in
         # most cases its updating is suspended anyway
-        return list(filter(lambda m: m is not self.mobject, self.get_all_mobjects()))
+        mobject = self.mobject
+        return [mob for mob in self.get_all_mobjects() if mob is not mobject]
 
     def copy(self) -> "Animation":
-        return deepcopy(self)
+        """Create a copy of the animation.
+
+        The animation is deep-copied, including all mobjects and animations
+        it holds, wherever they are stored. Only the rate function and the
+        placeholder mobject of :class:`Wait` are shared with the original.
+
+        Returns
+        -------
+        Animation
+            The copy.
+        """
+        # Pre-seeding the memo makes deepcopy use these objects as they are
+        memo = {id(shared): shared for shared in (self.rate_func, _EMPTY_MOBJECT)}
+        new = copy.deepcopy(self, memo)
+        # Keyed by the ids of the mobjects of the original
+        new._fam_cache = {}
+        return new
 
     # Methods for interpolation, the mean of an Animation
     def interpolate(self, alpha: float) -> None:
-        alpha = min(max(alpha, 0), 1)
+        alpha = 0.0 if alpha < 0.0 else (1.0 if alpha > 1.0 else alpha)
+        if self._rate_lut is not None:
+            rates, scale = self._rate_lut
+            index = alpha * scale
+            rounded = round(index)
+            # Only use the precomputed value if alpha falls on a frame
+            if abs(index - rounded) < 1e-6 and rounded < len(rates):
+                self.interpolate_mobject(rates[rounded])
+                return
         self.interpolate_mobject(self.rate_func(alpha))
 
-    @deprecated(until="v0.6.0", replacement="interpolate")
-    def update(self, alpha: float) -> None:
-        self.interpolate(alpha)
-
     def interpolate_mobject(self, alpha: float) -> None:
-        families = list(self.get_all_families_zipped())
-        for i, mobs in enumerate(families):
-            sub_alpha = self.get_sub_alpha(alpha, i, len(families))
-            self.interpolate_submobject(*mobs, sub_alpha)
+        families = self._families_cache
+        began = families is not None
+        if began:
+            uniform_alpha = self._uniform_alpha
+            default_sub_alpha = self._default_sub_alpha
+            # Families of (mobject, starting_mobject) are passed on as
+            # positional arguments instead of being star-unpacked.
+            pairwise = self._family_width == 2
+        else:
+            # Not started via begin(), e.g. when interpolated directly.
+            families = self.get_all_families_zipped()
+            default_sub_alpha = _has_default_sub_alpha(self)
+            uniform_alpha = default_sub_alpha and self.lag_ratio == 0
+            pairwise = False
+        interpolate_submobject = self.interpolate_submobject
+        if uniform_alpha:
+            # All submobjects share the same (clamped) alpha
+            sub_alpha = 0.0 if alpha < 0.0 else (1.0 if alpha > 1.0 else alpha)
+            if pairwise:
+                for submobject, starting_submobject in families:
+                    interpolate_submobject(submobject, starting_submobject, sub_alpha)
+            else:
+                for mobs in families:
+                    interpolate_submobject(*mobs, sub_alpha)
+            return
+        if began:
+            num_families = self._num_families
+        else:
+            # The families are aligned, so their length is that of
+            # the family of self.mobject.
+            num_families = len(self._families_of(self.mobject))
+        if default_sub_alpha:
+            sub_alphas = _compute_sub_alphas(
+                alpha, num_families, self.lag_ratio
+            ).tolist()
+        else:
+            get_sub_alpha = self.get_sub_alpha
+            sub_alphas = [
+                get_sub_alpha(alpha, i, num_families) for i in range(num_families)
+            ]
+        if pairwise:
+            for (submobject, starting_submobject), sub_alpha in zip(
+                families, sub_alphas
+            ):
+                interpolate_submobject(submobject, starting_submobject, sub_alpha)
+        else:
+            for mobs, sub_alpha in zip(families, sub_alphas):
+                interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(
         self,
@@ -166,8 +355,8 @@ class Animation:
         lag_ratio = self.lag_ratio
         full_length = (num_submobjects - 1) * lag_ratio + 1
         value = alpha * full_length
-        lower = index * lag_ratio
-        return min(max((value - lower), 0), 1)
+        sub_alpha = value - index * lag_ratio
+        return 0.0 if sub_alpha < 0.0 else (1.0 if sub_alpha > 1.0 else sub_alpha)
 
     # Getters and setters
     def set_run_time(self, run_time: float) -> "Animation":
@@ -182,6 +371,7 @@ class Animation:
         rate_func: Callable[[float], float],
     ) -> "Animation":
         self.rate_func = rate_func
+        self._rate_lut = None
         return self
 
     def get_rate_func(
@@ -238,16 +428,28 @@ def prepare_animation(
     raise TypeError(f"Object {anim} cannot be converted to an animation")
 
 
+# Placeholder mobject shared by all Wait animations
+_EMPTY_MOBJECT = Mobject()
+# quick fix to work in opengl setting:
+_EMPTY_MOBJECT.shader_wrapper_list = []
+
+
 class Wait(Animation):
+    needs_starting_mobject = False
+
+    __slots__ = ("duration", "stop_condition", "is_static_wait")
+
     def __init__(
         self, run_time: float = 1, stop_condition=None, **kwargs
     ):  # what is stop_condition?
         self.duration: float = run_time
         self.stop_condition = stop_condition
         self.is_static_wait: bool = False
-        super().__init__(None, run_time=run_time, **kwargs)
-        # quick fix to work in opengl setting:
-        self.mobject.shader_wrapper_list = []
+        # Wait never touches its mobject, so the Mobject allocations of
+        # Animation.__init__ are skipped.
+        self._init_attributes(
+            _EMPTY_MOBJECT, _EMPTY_MOBJECT, run_time=run_time, **kwargs
+        )
 
     def begin(self) -> None:
         pass
@@ -384,6 +384,8 @@ class ShowIncreasingSubsets(Animation):
                 self.wait()
     """
 
+    needs_starting_mobject = False
+
     def __init__(
         self,
         group: Mobject,
@@ -77,6 +77,8 @@ class ComplexHomotopy(Homotopy):
 
 
 class PhaseFlow(Animation):
+    needs_starting_mobject = False
+
     def __init__(
         self,
         function: Callable[[np.ndarray], np.ndarray],
@@ -118,6 +120,8 @@ class MoveAlongPath(Animation):
                 self.play(MoveAlongPath(d1, l1), rate_func=linear)
     """
 
+    needs_starting_mobject = False
+
     def __init__(
         self,
         mobject: "Mobject",
@@ -13,6 +13,8 @@ from ..utils.deprecation import deprecated_params
 
 
 class ChangingDecimal(Animation):
+    needs_starting_mobject = False
+
     @deprecated_params(
         "tracked_mobject position_update_func",
         until="v0.6.0",
@@ -130,7 +130,7 @@ class Transform(Animation):
             self.starting_mobject,
             self.target_copy,
         ]
-        return zip(*[mob.family_members_with_points() for mob in mobs])
+        return zip(*[self._families_of(mob) for mob in mobs])
 
     def interpolate_submobject(
         self,
@@ -19,6 +19,8 @@ class UpdateFromFunc(Animation):
     on another simultaneously animated mobject
     """
 
+    needs_starting_mobject = False
+
     def __init__(
         self,
         mobject: "Mobject",
@@ -41,6 +43,8 @@ class UpdateFromAlphaFunc(UpdateFromFunc):
 
 
 class MaintainPositionRelativeTo(Animation):
+    needs_starting_mobject = False
+
     def __init__(
         self, mobject: "Mobject", tracked_mobject: "Mobject", **kwargs
     ) -> None:
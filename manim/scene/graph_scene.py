@@ -1098,9 +1098,9 @@ class GraphScene(Scene):
                 if len(right_T_label) > 0:
                     right_T_label[0].set_fill(opacity=min(1, np.abs(t_max)))
 
-            Transform(area, new_area).update(1)
-            Transform(left_v_line, new_left_v_line).update(1)
-            Transform(right_v_line, new_right_v_line).update(1)
+            area.become(new_area)
+            left_v_line.become(new_left_v_line)
+            right_v_line.become(new_right_v_line)
             return group
 
         return UpdateFromAlphaFunc(group, update_group, run_time=run_time)
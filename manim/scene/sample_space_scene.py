@@ -128,7 +128,7 @@ class SampleSpaceScene(Scene):
     def get_posterior_rectangle_change_anims(self, post_rects):
         def update_rects(rects):
             new_rects = self.get_posterior_rectangles()
-            Transform(rects, new_rects).update(1)
+            rects.become(new_rects)
             if hasattr(rects, "braces"):
                 self.update_posterior_braces(rects)
             return rects
@@ -408,6 +408,10 @@ class Scene(Container):
 
         curr_mobjects = self.get_mobject_family_members()
         for animation in animations:
+            # The mobject of a Wait is only a placeholder, shared by all
+            # of them, so it must not end up in any scene
+            if isinstance(animation, Wait):
+                continue
             # Anything animated that's not already in the
             # scene gets added to the scene
             mob = animation.mobject
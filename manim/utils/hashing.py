@@ -10,10 +10,24 @@ from types import FunctionType, MappingProxyType, MethodType, ModuleType
 import numpy as np
 
 from .. import logger
+from ..animation.animation import Animation
 
 ALREADY_PROCESSED_ID = {}
 
 
+def _get_slot_values(obj):
+    """Return the attributes of ``obj`` stored in the ``__slots__`` of its classes."""
+    values = {}
+    for cls in reversed(type(obj).__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                values[slot] = getattr(obj, slot)
+    return values
+
+
 class CustomEncoder(json.JSONEncoder):
     def default(self, obj):
         """
@@ -65,6 +79,9 @@ class CustomEncoder(json.JSONEncoder):
             # Indeed, there is certainly no case where scene-caching will receive only a non instancied object, as this is never used in the library or encouraged to be used user-side.
             if isinstance(temp, MappingProxyType):
                 return "MappingProxy"
+            # The attributes of Animation are stored in __slots__, not in __dict__.
+            if isinstance(obj, Animation):
+                temp = {**_get_slot_values(obj), **temp}
             return self._check_iterable(temp)
         elif isinstance(obj, np.uint8):
             return int(obj)
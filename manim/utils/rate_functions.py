@@ -132,6 +132,30 @@ def rush_from(t: float, inflection: float = 10.0) -> float:
     return 2 * smooth(t / 2.0 + 0.5, inflection) - 1
 
 
+def _smooth_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    error = sigmoid(-inflection / 2)
+    return np.clip((sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+def _rush_into_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    return 2 * _smooth_array(t / 2.0, inflection)
+
+
+def _rush_from_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    return 2 * _smooth_array(t / 2.0 + 0.5, inflection) - 1
+
+
+# Array versions of rate functions, used to evaluate them for all
+# frames of an animation at once.
+_VECTORIZED_RATE_FUNCS: typing.Dict[
+    typing.Callable, typing.Callable[[np.ndarray], np.ndarray]
+] = {
+    smooth: _smooth_array,
+    rush_into: _rush_into_array,
+    rush_from: _rush_from_array,
+}
+
+
 def slow_into(t: float) -> float:
     return np.sqrt(1 - (1 - t) * (1 - t))
 
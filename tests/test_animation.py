@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+
+from manim import (
+    Animation,
+    Scene,
+    VGroup,
+    VMobject,
+    Wait,
+    config,
+    linear,
+    rush_from,
+    rush_into,
+    smooth,
+)
+
+
+class _RecordingAnimation(Animation):
+    def __init__(self, mobject, **kwargs):
+        super().__init__(mobject, **kwargs)
+        self.sub_alphas = []
+
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        self.sub_alphas.append(alpha)
+
+
+def get_group(n):
+    return VGroup(
+        *[VMobject().set_points_as_corners([[0, 0, 0], [1, 0, 0]]) for _ in range(n)]
+    )
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.2, 1])
+@pytest.mark.parametrize("alpha", [-0.5, 0, 0.3, 0.75, 1, 1.5])
+def test_sub_alphas_match_get_sub_alpha(lag_ratio, alpha):
+    """Test that interpolate_mobject hands out the alphas of get_sub_alpha."""
+    anim = _RecordingAnimation(get_group(5), lag_ratio=lag_ratio, rate_func=linear)
+    anim.begin()
+    anim.sub_alphas.clear()
+    anim.interpolate_mobject(alpha)
+    expected = [anim.get_sub_alpha(alpha, i, 5) for i in range(5)]
+    assert anim.sub_alphas == pytest.approx(expected)
+
+
+def test_sub_alphas_without_begin():
+    """Test that an animation can be interpolated without calling begin()."""
+    anim = _RecordingAnimation(get_group(4), lag_ratio=0.5, rate_func=linear)
+    anim.starting_mobject = anim.mobject.copy()
+    anim.interpolate_mobject(0.5)
+    expected = [anim.get_sub_alpha(0.5, i, 4) for i in range(4)]
+    assert anim.sub_alphas == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("rate_func", [smooth, rush_into, rush_from])
+@pytest.mark.parametrize("run_time", [1, 2.5])
+def test_precomputed_rate_func_matches_rate_func(run_time, rate_func):
+    """Test that the rate values precomputed in begin() match the rate function."""
+    rates = []
+
+    class RateAnimation(Animation):
+        def interpolate_mobject(self, alpha):
+            rates.append(alpha)
+
+    anim = RateAnimation(get_group(1), run_time=run_time, rate_func=rate_func)
+    anim.begin()
+    rates.clear()
+    times = np.arange(0, run_time, 1 / config["frame_rate"])
+    alphas = [t / run_time for t in times] + [0.123]
+    for alpha in alphas:
+        anim.interpolate(alpha)
+    assert rates == pytest.approx([rate_func(alpha) for alpha in alphas])
+
+    # On-frame alphas are looked up in the table, others are computed
+    assert anim._rate_lut is not None
+    table, scale = anim._rate_lut
+    anim._rate_lut = ([-1.0] * len(table), scale)
+    rates.clear()
+    anim.interpolate(times[1] / run_time)
+    anim.interpolate(0.123)
+    assert rates == pytest.approx([-1.0, rate_func(0.123)])
+
+
+def test_families_not_memoized_without_begin():
+    """Test that families are only cached while an animation is running."""
+    group = get_group(2)
+    anim = Animation(group)
+    assert len(list(anim.get_all_families_zipped())) == 0
+    anim.starting_mobject = group.copy()
+    assert len(list(anim.get_all_families_zipped())) == 2
+    assert anim._fam_cache == {}
+    anim.begin()
+    assert anim._fam_cache
+    anim.finish()
+    assert anim._fam_cache == {}
+
+
+def test_families_are_not_shared_between_animations():
+    """Test that an animation sees changes made while another one is running."""
+    group = VGroup(get_group(1)[0], VMobject())
+    first = Animation(group)
+    first.begin()
+    group[1].set_points_as_corners([[0, 0, 0], [1, 0, 0]])
+    second = Animation(group)
+    second.begin()
+    assert second._num_families == 2
+    second.finish()
+    first.finish()
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.5])
+def test_overridden_get_sub_alpha_is_used(lag_ratio):
+    """Test that interpolate_mobject() uses an overridden get_sub_alpha()."""
+
+    class FixedSubAlphaAnimation(_RecordingAnimation):
+        def get_sub_alpha(self, alpha, index, num_submobjects):
+            return 0.42
+
+    anim = FixedSubAlphaAnimation(get_group(3), lag_ratio=lag_ratio, rate_func=linear)
+    anim.begin()
+    anim.sub_alphas.clear()
+    anim.interpolate_mobject(0.5)
+    assert anim.sub_alphas == pytest.approx([0.42] * 3)
+
+
+def test_lag_ratio_set_before_begin():
+    """Test that a lag_ratio set after construction, as done by Scene.play, is used."""
+    anim = _RecordingAnimation(get_group(3), rate_func=linear)
+    anim.lag_ratio = 1
+    anim.begin()
+    anim.sub_alphas.clear()
+    anim.interpolate_mobject(0.5)
+    assert anim.sub_alphas == pytest.approx([1, 0.5, 0])
+
+
+@pytest.mark.parametrize("anim_cls", [Animation, Wait])
+def test_play_kwargs_are_set_on_animations(anim_cls):
+    """Test that Scene.play() keyword arguments can be set on any animation."""
+    anim = anim_cls(get_group(1)) if anim_cls is Animation else anim_cls()
+    (compiled,) = Scene().compile_animations(anim, run_time=3, some_kwarg=42)
+    assert compiled.run_time == 3
+    assert compiled.some_kwarg == 42
+
+
+def test_wait_honours_animation_kwargs():
+    wait = Wait(2, remover=True, suspend_mobject_updating=False, name="pause")
+    assert wait.run_time == 2
+    assert wait.remover
+    assert not wait.suspend_mobject_updating
+    assert wait.name == "pause"
+
+
+def test_wait_placeholder_is_not_shared_between_scenes():
+    """Test that the mobject shared by all Wait animations stays out of scenes."""
+    first, second = Scene(), Scene()
+    first.add_mobjects_from_animations([Wait()])
+    second.add_mobjects_from_animations([Wait(), Animation(get_group(1))])
+    assert first.mobjects == []
+    assert Wait().mobject not in second.mobjects
+    assert len(second.mobjects) == 1
@@ -1,6 +1,16 @@
 from pathlib import Path
 
-from manim import BraceLabel, Mobject, config
+from manim import (
+    Animation,
+    AnimationGroup,
+    BraceLabel,
+    FadeIn,
+    Mobject,
+    Square,
+    Transform,
+    Wait,
+    config,
+)
 
 
 def test_mobject_copy():
@@ -16,6 +26,69 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_animation_copy():
+    """Test that copying an animation copies its mobjects."""
+    mob = Mobject()
+    mob.add(*[Mobject() for _ in range(3)])
+    orig = Animation(mob, lag_ratio=0.5)
+    copy = orig.copy()
+
+    assert type(copy) is Animation
+    assert copy.mobject is not orig.mobject
+    assert len(copy.mobject.submobjects) == 3
+    assert copy.starting_mobject is not orig.starting_mobject
+    assert copy.rate_func is orig.rate_func
+    assert copy.lag_ratio == 0.5
+
+
+def test_animation_group_copy():
+    """Test that copying an AnimationGroup copies its animations and group."""
+    sq = Square()
+    orig = AnimationGroup(FadeIn(sq))
+    copy = orig.copy()
+
+    assert copy.animations is not orig.animations
+    assert copy.animations[0] is not orig.animations[0]
+    assert copy.animations[0].mobject is not sq
+    assert copy.group is copy.mobject
+    assert copy.animations[0].mobject in copy.group.submobjects
+
+
+def test_transform_copy():
+    """Test that copying a Transform copies its target."""
+    orig = Transform(Square(), Square().shift(2))
+    copy = orig.copy()
+
+    assert copy.mobject is not orig.mobject
+    assert copy.target_mobject is not orig.target_mobject
+
+
+def test_slotted_animation_copy():
+    """Test that copying an animation copies mobjects stored in slots."""
+
+    class SlottedAnimation(Animation):
+        __slots__ = ("target",)
+
+        def __init__(self, mobject, target, **kwargs):
+            super().__init__(mobject, **kwargs)
+            self.target = target
+
+    orig = SlottedAnimation(Square(), Square())
+    copy = orig.copy()
+
+    assert copy.target is not orig.target
+    assert copy.rate_func is orig.rate_func
+
+
+def test_wait_copy():
+    """Test that copying a Wait shares its placeholder mobject."""
+    orig = Wait(2)
+    copy = orig.copy()
+
+    assert copy.mobject is orig.mobject
+    assert copy.run_time == 2
+
+
 def test_bracelabel_copy(tmp_path):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
@@ -1,6 +1,7 @@
 import json
 
 import manim.utils.hashing as hashing
+from manim import Animation
 
 
 def test_JSON_basic():
@@ -26,6 +27,15 @@ def test_JSON_with_object():
     )
 
 
+def test_JSON_with_animation():
+    anim = Animation(None, run_time=3)
+    anim.some_kwarg = 7
+    o_serialized = hashing.get_json(anim)
+    # Attributes from both __slots__ and __dict__ are serialized
+    assert '"run_time": 3' in o_serialized
+    assert '"some_kwarg": 7' in o_serialized
+
+
 def test_JSON_with_function():
     def test(uhu):
         uhu += 2